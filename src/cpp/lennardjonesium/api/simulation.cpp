@@ -22,6 +22,7 @@
 
 #include <cassert>
 #include <memory>
+#include <optional>
 #include <variant>
 #include <vector>
 #include <utility>
@@ -46,12 +47,7 @@
 namespace api
 {
     Simulation::Simulation(Simulation::Parameters parameters)
-        : parameters_{parameters},
-          initial_condition_{
-              parameters.system_parameters,
-              parameters.random_seed,
-              parameters.unit_cell
-          }
+        : parameters_{parameters}
     {
         // We need to create the ShortRangeForce
         auto short_range_force_constructor = tools::OverloadedVisitor
@@ -99,8 +95,10 @@ namespace api
             .snapshot_log = snapshot_stream
         }};
         
-        // Create initial state and SimulationController
-        auto initial_state = initial_condition_.system_state();
+        // Create initial state and SimulationController.  The InitialCondition is built lazily
+        // on the first run() call, so that the O(particle_count) setup work happens in the
+        // thread which actually runs the simulation.
+        auto initial_state = initial_condition_ref_().system_state();
         auto simulation_controller = make_simulation_controller_(logger);
 
         // Run the actual simulation
@@ -116,11 +114,29 @@ namespace api
         snapshot_stream.close();
     }
 
+    engine::InitialCondition& Simulation::initial_condition_ref_()
+    {
+        /**
+         * NOTE: A single Simulation is only ever run by one thread at a time (the SimulationPool
+         * workers each own the job they popped from the queue), so no locking is needed here.
+         */
+        if (!initial_condition_.has_value())
+        {
+            initial_condition_.emplace(
+                parameters_.system_parameters,
+                parameters_.random_seed,
+                parameters_.unit_cell
+            );
+        }
+
+        return initial_condition_.value();
+    }
+
     control::SimulationController Simulation::make_simulation_controller_(output::Logger& logger)
     {
         // First build the integrator
         auto integrator = engine::Integrator::Builder(parameters_.time_delta)
-            .bounding_box(initial_condition_.bounding_box())
+            .bounding_box(initial_condition_ref_().bounding_box())
             .short_range_force(*short_range_force_)
             .build();
         
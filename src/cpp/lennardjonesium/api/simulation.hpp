@@ -24,6 +24,7 @@
 #define LJ_SIMULATION_HPP
 
 #include <memory>
+#include <optional>
 #include <variant>
 #include <random>
 #include <vector>
@@ -151,7 +152,18 @@ namespace api
         
         private:
             Parameters parameters_;
-            engine::InitialCondition initial_condition_;
+
+            /**
+             * The InitialCondition places every particle on the lattice and draws its velocity
+             * from the desired distribution, which is O(particle_count) work.  We defer this
+             * until the first run() call, so that when Simulations are queued on a
+             * SimulationPool, the setup work happens inside the worker threads rather than
+             * serially on the thread that constructs all the Simulation objects.
+             */
+            std::optional<engine::InitialCondition> initial_condition_;
+
+            // Construct the InitialCondition on first use
+            engine::InitialCondition& initial_condition_ref_();
 
             // We use a pointer to the generic ShortRangeForce, in case we might like to implement
             // other ShortRangeForces in the future
@@ -23,6 +23,7 @@
 #include <vector>
 #include <mutex>
 #include <thread>
+#include <chrono>
 #include <algorithm>
 #include <ranges>
 
@@ -43,33 +44,70 @@ namespace api
 
     SimulationPool::Status SimulationPool::status()
     {
-        std::lock_guard<std::mutex> lock(mutex_);
+        // The counters are read individually, so the snapshot is only approximately consistent;
+        // this has always been acceptable for status reporting, and now no lock is needed.
+        // Reading in completion order (completed, then started, then queued) keeps the derived
+        // waiting/running numbers from ever appearing negative.
+        int completed = completed_.load();
+        int started = started_.load();
+        int queued = queued_.load();
 
         return SimulationPool::Status{
-            .queued = queued_,
-            .waiting = queued_ - started_,
-            .started = started_,
-            .running = started_ - completed_,
-            .completed = completed_
+            .queued = queued,
+            .waiting = queued - started,
+            .started = started,
+            .running = started - completed,
+            .completed = completed
         };
     }
 
+    void SimulationPool::push_many(const std::vector<Simulation*>& simulations)
+    {
+        // As in push(), the count must be incremented before the jobs become visible to the
+        // workers, or else started_ could overtake queued_.  One atomic add covers the batch.
+        queued_ += static_cast<int>(simulations.size());
+
+        for (Simulation* simulation : simulations)
+        {
+            jobs_.put(*simulation);
+        }
+    }
+
     void SimulationPool::increment_queued_()
     {
-        std::lock_guard<std::mutex> lock(mutex_);
         ++queued_;
     }
 
     void SimulationPool::increment_started_()
     {
-        std::lock_guard<std::mutex> lock(mutex_);
         ++started_;
     }
 
     void SimulationPool::increment_completed_()
     {
-        std::lock_guard<std::mutex> lock(mutex_);
-        ++completed_;
+        // The increment itself is lock free, but we must still synchronize with mutex_ before
+        // notifying, or else a waiter could check its predicate and block just after the
+        // increment and miss the wakeup
+        {
+            std::lock_guard<std::mutex> lock(mutex_);
+            ++completed_;
+        }
+
+        // Signal anyone waiting on job completion
+        progress_signal_.notify_all();
+    }
+
+    void SimulationPool::wait_for_progress(double timeout)
+    {
+        std::unique_lock<std::mutex> lock(mutex_);
+
+        int completed = completed_;
+
+        progress_signal_.wait_for(
+            lock,
+            std::chrono::duration<double>(timeout),
+            [this, completed]() {return completed_ > completed;}
+        );
     }
 
     void SimulationPool::wait()
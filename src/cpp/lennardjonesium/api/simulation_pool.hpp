@@ -24,7 +24,9 @@
 #define LJ_SIMULATION_POOL_HPP
 
 #include <vector>
+#include <atomic>
 #include <mutex>
+#include <condition_variable>
 #include <thread>
 #include <functional>
 
@@ -51,6 +53,10 @@ namespace api
                 jobs_.put(simulation);
             }
 
+            // Add a batch of simulation jobs to the queue.  The queued count is updated with a
+            // single atomic add, rather than once per job.
+            void push_many(const std::vector<Simulation*>& simulations);
+
             // Indicate we are done pushing jobs to the queue (will shut down the workers after they
             // finish their current jobs).
             void close() {jobs_.close();}
@@ -58,6 +64,12 @@ namespace api
             // Wait for all jobs to finish
             void wait();
 
+            // Block until at least one further job completes, or until the timeout (in seconds)
+            // expires, whichever comes first.  This allows a status reporter to sleep between
+            // updates without adding up to a full polling interval of latency after the last
+            // job finishes.
+            void wait_for_progress(double timeout);
+
             // Status struct allows us to get information about the queued jobs
             struct Status
             {
@@ -96,13 +108,19 @@ namespace api
             // The job queue
             tools::MessageBuffer<std::reference_wrapper<Simulation>> jobs_;
 
-            // These track the state of the queue
+            // The mutex exists only to pair with progress_signal_; the counters themselves are
+            // atomic, so the hot path through the workers never contends on a shared lock
             std::mutex mutex_;
-            int queued_{};
-            int started_{};
-            int completed_{};
 
-            // These wrap mutex accesses for changing the state
+            // Signaled whenever a job completes, so that waiters do not need to poll
+            std::condition_variable progress_signal_;
+
+            // These track the state of the queue
+            std::atomic<int> queued_{};
+            std::atomic<int> started_{};
+            std::atomic<int> completed_{};
+
+            // These wrap the counter updates for changing the state
             void increment_queued_();
             void increment_started_();
             void increment_completed_();
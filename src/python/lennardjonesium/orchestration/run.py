@@ -21,11 +21,9 @@ License along with Lennard-Jonesium.  If not, see
 """
 
 
-import os
 import pathlib
 from typing import Union, Optional
 from types import FunctionType, BuiltinFunctionType
-from copy import deepcopy
 import textwrap
 import time
 
@@ -72,7 +70,7 @@ def run(
     if config_object is None:
         cfg = Configuration.from_file(config_filepath)
     else:
-        cfg = deepcopy(config_object)
+        cfg = config_object.clone()
     
     if isinstance(random_seed, int):
         cfg.system.random_seed = random_seed
@@ -83,11 +81,16 @@ def run(
     config_filepath.parent.mkdir(parents=True, exist_ok=True)
     cfg.write(config_filepath)
 
+    # Rather than changing the process-wide working directory (which is global state and not
+    # thread safe), we resolve the output filepaths against the directory that contains the
+    # config file.  (Joining with an already-absolute path leaves it unchanged.)
+    base_dir = config_filepath.parent
+    cfg.filepaths.event_log = str(base_dir / cfg.filepaths.event_log)
+    cfg.filepaths.thermodynamic_log = str(base_dir / cfg.filepaths.thermodynamic_log)
+    cfg.filepaths.observation_log = str(base_dir / cfg.filepaths.observation_log)
+    cfg.filepaths.snapshot_log = str(base_dir / cfg.filepaths.snapshot_log)
+
     if echo_status: _preamble(cfg)
-    
-    # Change working directory to the directory where the config file is located
-    cwd = os.getcwd()
-    os.chdir(config_filepath.parent)
 
     # Create the Simulation object and run the simulation
     sim = Simulation(cfg)
@@ -96,9 +99,6 @@ def run(
     sim.run(echo=echo_status)
     end_time = time.perf_counter()
 
-    # Restore the working directory
-    os.chdir(cwd)
-
     # Read results from event log
     run_result = RunResult(config_filepath)
 
@@ -107,33 +107,43 @@ def run(
     return run_result
 
 
-def _preamble(cfg: Configuration):
-    """
-    Prints information about the simulation to be run from the given Configuration object
-    """
+# The informational banners below are dedented once at import time, so that only the .format()
+# call remains to be done when they are printed
+_PREAMBLE_TEMPLATE = textwrap.dedent("""\
+    ==================== Lennard-Jones Simulation ====================
+
+    Temperature: {cfg.system.temperature}
+    Density: {cfg.system.density}
+    Number of Particles: {cfg.system.particle_count}
+    Time Step: {cfg.system.time_delta}
+    Random Seed: {cfg.system.random_seed}
 
-    preamble = f"""\
-        ==================== Lennard-Jones Simulation ====================
+    Simulation will run in 2 phases:
+    Phase 1: {cfg.equilibration.name}
+    Phase 2: {cfg.observation.name}
 
-        Temperature: {cfg.system.temperature}
-        Density: {cfg.system.density}
-        Number of Particles: {cfg.system.particle_count}
-        Time Step: {cfg.system.time_delta}
-        Random Seed: {cfg.system.random_seed}
+    Results to be output to the following files:
+    Events: {cfg.filepaths.event_log}
+    Thermodynamics: {cfg.filepaths.thermodynamic_log}
+    Observations: {cfg.filepaths.observation_log}
+    Snapshots: {cfg.filepaths.snapshot_log}
 
-        Simulation will run in 2 phases:
-        Phase 1: {cfg.equilibration.name}
-        Phase 2: {cfg.observation.name}
+    Begin simulation...""")
 
-        Results to be output to the following files:
-        Events: {cfg.filepaths.event_log}
-        Thermodynamics: {cfg.filepaths.thermodynamic_log}
-        Observations: {cfg.filepaths.observation_log}
-        Snapshots: {cfg.filepaths.snapshot_log}
 
-        Begin simulation..."""
+_POSTAMBLE_TEMPLATE = textwrap.dedent("""\
+    End simulation
 
-    print(textwrap.dedent(preamble), flush=True)
+    {time_steps} time steps computed in {elapsed_time:.3f} seconds
+    {seconds_per_step:.3f} seconds per step, or {milliseconds:.3f} milliseconds
+    Framerate: {steps_per_second:.3f} fps""")
+
+
+def _preamble(cfg: Configuration):
+    """
+    Prints information about the simulation to be run from the given Configuration object
+    """
+    print(_PREAMBLE_TEMPLATE.format(cfg=cfg), flush=True)
 
 
 def _postamble(event_data: RunResult, elapsed_time: float):
@@ -145,11 +155,13 @@ def _postamble(event_data: RunResult, elapsed_time: float):
     seconds_per_step = elapsed_time / time_steps
     steps_per_second = time_steps / elapsed_time
 
-    postamble = f"""\
-        End simulation
-
-        {time_steps} time steps computed in {elapsed_time:.3f} seconds
-        {seconds_per_step:.3f} seconds per step, or {seconds_per_step * 1000:.3f} milliseconds
-        Framerate: {steps_per_second:.3f} fps"""
-
-    print(textwrap.dedent(postamble), flush=True)
+    print(
+        _POSTAMBLE_TEMPLATE.format(
+            time_steps=time_steps,
+            elapsed_time=elapsed_time,
+            seconds_per_step=seconds_per_step,
+            milliseconds=seconds_per_step * 1000,
+            steps_per_second=steps_per_second
+        ),
+        flush=True
+    )
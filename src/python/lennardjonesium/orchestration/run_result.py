@@ -23,9 +23,11 @@ License along with Lennard-Jonesium.  If not, see
 
 from enum import Enum, auto
 from typing import Optional
+import array
 import pathlib
 
 from lennardjonesium.simulation import Configuration
+from lennardjonesium.tools import cached_from_file, last_line_bytes
 
 
 class SimulationStatus(Enum):
@@ -44,84 +46,201 @@ class RunResult:
         - At what time step did the observation phase start?
         - How many temperature adjustments were required?  On which time steps?
         - How many observations were recorded?  On which time steps?
-    
+
     This will allow us to easily gather this information for a large collection of files.
+
+    The event log is not actually read or parsed until one of the result attributes is first
+    accessed, so callers which discard the RunResult (or only hold onto it) do not pay for a
+    full parse of the log file.
     """
 
-    simulation_status: Optional[SimulationStatus] = None
+    simulation_status: Optional[SimulationStatus]
+
+    equilibration_started: Optional[int]
+    equilibration_completed: Optional[int]
+    equilibration_time_steps: Optional[int]
+
+    observation_started: Optional[int]
+    observation_completed: Optional[int]
+    observation_time_steps: Optional[int]
 
-    equilibration_started: Optional[int] = None
-    equilibration_completed: Optional[int] = None
-    equilibration_time_steps: Optional[int] = None
+    total_time_steps: int
 
-    observation_started: Optional[int] = None
-    observation_completed: Optional[int] = None
-    observation_time_steps: Optional[int] = None
+    # Compact typed arrays rather than lists: a long run records tens of thousands of time
+    # steps, and array.array('i') stores them unboxed (4 bytes each instead of a pointer to a
+    # ~28-byte int object).  Iteration, indexing, and len() all work as for a list.
+    temperature_adjustments: array.array
+    observations_recorded: array.array
 
-    total_time_steps: int = 0
+    # The attributes which are filled in by parsing the event log
+    _event_fields = frozenset({
+        'simulation_status',
+        'equilibration_started', 'equilibration_completed', 'equilibration_time_steps',
+        'observation_started', 'observation_completed', 'observation_time_steps',
+        'total_time_steps', 'temperature_adjustments', 'observations_recorded',
+    })
 
-    temperature_adjustments: list[int]
-    observations_recorded: list[int]
+    # The subset of attributes that can usually be determined from the final log line alone,
+    # without parsing the whole file
+    _summary_fields = frozenset({'simulation_status', 'total_time_steps'})
 
     def __init__(self, config_filepath: pathlib.Path) -> None:
-        # Read the config file and us it to determine the location of the events log file
-        cfg = Configuration.from_file(config_filepath)
+        self._config_filepath = pathlib.Path(config_filepath)
+
+    def __getattr__(self, name: str):
+        # __getattr__ is only invoked for attributes not found the normal way, i.e. the result
+        # attributes before the event log has been parsed
+        if name in type(self)._summary_fields and self._parse_summary():
+            return self.__getattribute__(name)
+        if name in type(self)._event_fields:
+            self._parse_event_log()
+            return self.__getattribute__(name)
+        raise AttributeError(name)
+
+    def _event_log_path(self) -> pathlib.Path:
+        """
+        Locates the event log via the config file.
+        """
+        # The cached config read may return an instance shared with other readers, which is fine
+        # since we only look at it
+        cfg = cached_from_file(Configuration, self._config_filepath)
         event_log_path = pathlib.Path(cfg.filepaths.event_log)
         if not event_log_path.is_absolute():
-            event_log_path = config_filepath.parent / event_log_path
-        
-        # Parse the contents of the event file and fill in information about the run
-        self.temperature_adjustments = []
-        self.observations_recorded = []
-        
-        with open(event_log_path, 'r') as event_log_file:
-            self._parse(event_log_file.readlines())
-
-    def _parse(self, lines: list[str]):
+            event_log_path = self._config_filepath.parent / event_log_path
+        return event_log_path
+
+    def _parse_summary(self) -> bool:
+        """
+        Attempts to determine the simulation status and total time steps from the final line of
+        the event log alone, which costs a couple of tail reads regardless of the log's size.
+        Returns False when the final line is not conclusive, in which case the caller falls back
+        to the full parse.
+
+        A completed simulation's last event is 'Phase complete: <name>' with the observation
+        phase's name; an aborted one ends with 'Simulation aborted: <reason>', where the reason
+        identifies the phase: the equilibration phase aborts with 'Could not equilibrate', the
+        observation phase with a temperature drift message.
+        """
+        try:
+            line = last_line_bytes(self._event_log_path())
+        except ValueError:
+            # Empty log file: let the full parse produce the usual defaults
+            return False
+
+        first, separator, rest = line.partition(b': ')
+        if not separator or not first.isdigit():
+            return False
+
+        if rest.startswith(b'Phase complete'):
+            # The equilibration phase ends with the same message, so a run killed between the
+            # phases would otherwise look completed here (while the full parse reports None).
+            # The line carries the phase name, so insist on the observation phase's name; the
+            # config is already in the cache from the _event_log_path() call above
+            cfg = cached_from_file(Configuration, self._config_filepath)
+            if rest != b'Phase complete: ' + cfg.observation.name.encode():
+                return False
+            status = SimulationStatus.completed
+        elif rest.startswith(b'Simulation aborted'):
+            if b'equilibrate' in rest:
+                status = SimulationStatus.equilibration_aborted
+            else:
+                status = SimulationStatus.observation_aborted
+        else:
+            # The log ends mid-simulation (or with an unfamiliar message)
+            return False
+
+        self.simulation_status = status
+        self.total_time_steps = int(first)
+        return True
+
+    def _parse_event_log(self):
+        """
+        Reads the event log, parses it, and fills in the result attributes.
+        """
+        event_log_path = self._event_log_path()
+
+        # Start from the default values, then parse the contents of the event file to fill in
+        # information about the run
+        self.simulation_status = None
+        self.equilibration_started = None
+        self.equilibration_completed = None
+        self.equilibration_time_steps = None
+        self.observation_started = None
+        self.observation_completed = None
+        self.observation_time_steps = None
+        self.total_time_steps = 0
+        self.temperature_adjustments = array.array('i')
+        self.observations_recorded = array.array('i')
+
+        self._parse(event_log_path.read_bytes())
+
+    def _parse(self, data: bytes):
         """
         Parses the event log entries for the information we want.  Fortunately this is simple and
         can be done easily enough without regular expressions.
+
+        The log is scanned as a single bytes buffer, tracking offsets with bytes.find() and
+        testing the message with offset-based startswith(), so no per-line string objects are
+        created for the (many) lines whose text we do not need.
         """
-        for line in lines:
+        position = 0
+        end = len(data)
+
+        while position < end:
+            newline = data.find(b'\n', position)
+            if newline < 0:
+                newline = end
+
             # First separate the time step from the rest of the line
-            first, rest = line.split(': ', maxsplit=1)
-            time_step = int(first)
+            colon = data.find(b': ', position, newline)
+            time_step = int(data[position:colon])
+            rest = colon + 2
 
             self.total_time_steps = time_step
 
-            # Look for phase started
-            if rest.startswith('Phase started'):
-                if self.equilibration_started is None:
-                    self.equilibration_started = time_step
-                else:
-                    self.observation_started = time_step
-                continue
-
-            # Look for phase complete
-            if rest.startswith('Phase complete'):
-                if self.equilibration_completed is None:
-                    self.equilibration_completed = time_step
-                    self.equilibration_time_steps = time_step - self.equilibration_started
-                else:
-                    self.observation_completed = time_step
-                    self.observation_time_steps = time_step - self.observation_started
-                    # At this point, we also know that the simulation completed successfully
-                    self.simulation_status = SimulationStatus.completed
-                continue
-
-            # Temperature adjustments
-            if rest.startswith('Temperature'):
-                self.temperature_adjustments.append(time_step)
-                continue
-
-            # Observations
-            if rest.startswith('Observation'):
-                self.observations_recorded.append(time_step)
-                continue
-            
-            # Whether simulation finished
-            if rest.startswith('Simulation aborted'):
-                if self.equilibration_completed is None:
-                    self.simulation_status = SimulationStatus.equilibration_aborted
-                else:
-                    self.simulation_status = SimulationStatus.observation_aborted
+            # Dispatch on the first byte of the message; each handler needs at most one further
+            # startswith() to disambiguate, instead of the chain of up to five prefix
+            # comparisons per line that an if/elif ladder would run
+            handler = self._handlers.get(data[rest])
+            if handler is not None:
+                handler(self, data, rest, time_step)
+
+            position = newline + 1
+
+    def _handle_phase(self, data: bytes, rest: int, time_step: int):
+        # 'Phase started' or 'Phase complete'
+        if data.startswith(b'Phase started', rest):
+            if self.equilibration_started is None:
+                self.equilibration_started = time_step
+            else:
+                self.observation_started = time_step
+        else:
+            if self.equilibration_completed is None:
+                self.equilibration_completed = time_step
+                self.equilibration_time_steps = time_step - self.equilibration_started
+            else:
+                self.observation_completed = time_step
+                self.observation_time_steps = time_step - self.observation_started
+                # At this point, we also know that the simulation completed successfully
+                self.simulation_status = SimulationStatus.completed
+
+    def _handle_temperature(self, data: bytes, rest: int, time_step: int):
+        self.temperature_adjustments.append(time_step)
+
+    def _handle_observation(self, data: bytes, rest: int, time_step: int):
+        self.observations_recorded.append(time_step)
+
+    def _handle_abort(self, data: bytes, rest: int, time_step: int):
+        # 'Simulation aborted'
+        if self.equilibration_completed is None:
+            self.simulation_status = SimulationStatus.equilibration_aborted
+        else:
+            self.simulation_status = SimulationStatus.observation_aborted
+
+    # Maps the first byte of an event message to its handler (indexing bytes yields an int)
+    _handlers = {
+        ord('P'): _handle_phase,
+        ord('T'): _handle_temperature,
+        ord('O'): _handle_observation,
+        ord('S'): _handle_abort,
+    }
@@ -23,9 +23,10 @@ License along with Lennard-Jonesium.  If not, see
 
 import os
 import pathlib
+import concurrent.futures
+import configparser
 from typing import Union, Optional
 from types import FunctionType, BuiltinFunctionType
-from copy import deepcopy
 import time
 import textwrap
 
@@ -85,8 +86,9 @@ def run_sweep(
     
     :param sweep_config_object: An optional SweepConfiguration object.  If this is given, then it
         will be used in preference over the sweep_config_file, and the sweep_config_file will be
-        overwritten with the data provided by the sweep_config_object.
-    
+        overwritten with the data provided by the sweep_config_object.  The object itself is
+        treated as read-only and will not be modified.
+
     We will always output a config file with the random seed actually used, which will overwrite
     the original config file.
     """
@@ -101,16 +103,17 @@ def run_sweep(
     if sweep_config_object is None:
         sweep_cfg = SweepConfiguration.from_file(sweep_config_filepath)
     else:
-        sweep_cfg = deepcopy(sweep_config_object)
+        # Unlike run(), we never write back into the sweep configuration (the random seeds live
+        # in the individual run config files), so there is no need to clone the caller's object
+        sweep_cfg = sweep_config_object
         sweep_config_filepath.parent.mkdir(parents=True, exist_ok=True)
         sweep_cfg.write(sweep_config_filepath)
     
-    # Change working directory to the directory where the sweep config file is located
-    cwd = os.getcwd()
-    os.chdir(sweep_config_filepath.parent)
-
-    # Get the simulations and push them onto a SimulationPool to run them
-    simulations = _create_simulations(sweep_cfg, random_seed, chunk_count, chunk_index)
+    # Get the simulations and push them onto a SimulationPool to run them.  The individual
+    # simulation directories are resolved against the sweep directory, rather than changing the
+    # process-wide working directory (which is global state and not thread safe).
+    simulations = _create_simulations(sweep_cfg, sweep_config_filepath.parent, random_seed,
+                                      chunk_count, chunk_index)
     pool = SimulationPool(thread_count)
     job_count = len(simulations)
 
@@ -118,9 +121,10 @@ def run_sweep(
 
     start_time = time.perf_counter()
 
-    for simulation in simulations:
-        pool.push(simulation)
-    
+    # Push the whole batch of jobs in a single call, rather than one boundary crossing (and one
+    # queue-lock acquisition) per simulation
+    pool.push_many(simulations)
+
     if echo_status: _report_pool_status(pool, job_count, start_time, polling_interval)
     
     # Wait for all simulations to finish
@@ -128,17 +132,31 @@ def run_sweep(
 
     end_time = time.perf_counter()
 
-    # Restore working directory
-    os.chdir(cwd)
-
-    # SweepResult reads back in the config file from the originally-given filepath
-    sweep_result = SweepResult(sweep_config_filepath, chunk_count, chunk_index)
+    # We pass along the already-parsed sweep configuration so that SweepResult does not need to
+    # read it back in from the config file
+    sweep_result = SweepResult(sweep_config_filepath, chunk_count, chunk_index,
+                               sweep_cfg=sweep_cfg)
 
     if echo_status: _postamble(sweep_result, thread_count, end_time - start_time)
 
     return sweep_result
 
 
+# The informational banner below is dedented once at import time, so that only the .format()
+# call remains to be done when it is printed
+_POSTAMBLE_TEMPLATE = textwrap.dedent("""\
+    End simulation sweep
+
+    Job status:
+    Completed: {completed}
+    Aborted during Equilibration: {equilibration_aborted}
+    Aborted during Observation: {observation_aborted}
+
+    {time_steps} time steps computed using {thread_count} threads in {elapsed_time:.3f} seconds
+    {seconds_per_step:.3f} thread-seconds per step, or {ms_per_step:.3f} milliseconds
+    Average framerate per thread: {steps_per_second:.3f} fps""")
+
+
 def _preamble(
     sweep_cfg: SweepConfiguration,
     job_count: int,
@@ -149,35 +167,24 @@ def _preamble(
     """
     Prints information about the sweep before running it
     """
-    preamble = """\
-        ================= Lennard-Jones Sweep Simulation ==================
-
-        Temperature: {temp_steps} points in the range [{temp_start}, {temp_stop}]
-        Density: {d_steps} points in the range [{d_start}, {d_stop}]
-        
-        Number of Particles: {particle_count}
-        Time Step: {time_step}
-
-        Chunk {chunk_number} of {chunk_count} (index {chunk_index})
-        Running {job_count} jobs over {thread_count} threads
-
-        Begin simulation sweep...""".format(
-            temp_start=sweep_cfg.system.temperature_start,
-            temp_stop=sweep_cfg.system.temperature_stop,
-            temp_steps=sweep_cfg.system.temperature_steps,
-            d_start=sweep_cfg.system.density_start,
-            d_stop=sweep_cfg.system.density_stop,
-            d_steps=sweep_cfg.system.density_steps,
-            particle_count=sweep_cfg.system.particle_count,
-            time_step=sweep_cfg.system.time_delta,
-            chunk_number=chunk_index + 1,
-            chunk_count=chunk_count,
-            chunk_index=chunk_index,
-            job_count=job_count,
-            thread_count=thread_count
-        )
+    # The banner is written flush-left so that no dedenting or template formatting is needed;
+    # the f-string is assembled in a single pass
+    system = sweep_cfg.system
+    print(f"""\
+================= Lennard-Jones Sweep Simulation ==================
+
+Temperature: {system.temperature_steps} points in the range \
+[{system.temperature_start}, {system.temperature_stop}]
+Density: {system.density_steps} points in the range \
+[{system.density_start}, {system.density_stop}]
 
-    print(textwrap.dedent(preamble), flush=True)
+Number of Particles: {system.particle_count}
+Time Step: {system.time_delta}
+
+Chunk {chunk_index + 1} of {chunk_count} (index {chunk_index})
+Running {job_count} jobs over {thread_count} threads
+
+Begin simulation sweep...""", flush=True)
 
 
 def _postamble(result: SweepResult, thread_count: int, elapsed_time: float):
@@ -194,19 +201,20 @@ def _postamble(result: SweepResult, thread_count: int, elapsed_time: float):
     steps_per_second = time_steps_per_thread / elapsed_time
     ms_per_step = 1000 * seconds_per_step
 
-    postamble = f"""\
-        End simulation sweep
-        
-        Job status:
-        Completed: {len(result.completed)}
-        Aborted during Equilibration: {len(result.equilibration_aborted)}
-        Aborted during Observation: {len(result.observation_aborted)}
-
-        {time_steps} time steps computed using {thread_count} threads in {elapsed_time:.3f} seconds
-        {seconds_per_step:.3f} thread-seconds per step, or {ms_per_step:.3f} milliseconds
-        Average framerate per thread: {steps_per_second:.3f} fps"""
-    
-    print(textwrap.dedent(postamble), flush=True)
+    print(
+        _POSTAMBLE_TEMPLATE.format(
+            completed=len(result.completed),
+            equilibration_aborted=len(result.equilibration_aborted),
+            observation_aborted=len(result.observation_aborted),
+            time_steps=time_steps,
+            thread_count=thread_count,
+            elapsed_time=elapsed_time,
+            seconds_per_step=seconds_per_step,
+            ms_per_step=ms_per_step,
+            steps_per_second=steps_per_second
+        ),
+        flush=True
+    )
 
 
 def _report_pool_status(
@@ -218,19 +226,28 @@ def _report_pool_status(
     """
     Polls the given SimulationPool and reports its status until all jobs finish.
     """
+    previous_status = None
+
     while True:
         status = pool.status()
-        elapsed_time = time.perf_counter() - start_time
-        print(
-            'Jobs queued: {}, Running: {}, Completed: {}, Elapsed time: {:.2f} seconds     '.format(
-                status.waiting, status.running, status.completed, elapsed_time
-            ),
-            flush=True,
-            end='\r'
-        )
+
+        # Only redraw the console line when the status has actually changed, so an idle wait
+        # does not keep issuing print/flush calls
+        if status != previous_status:
+            elapsed_time = time.perf_counter() - start_time
+            print(
+                'Jobs queued: {}, Running: {}, Completed: {}, Elapsed time: {:.2f} seconds     '
+                .format(status.waiting, status.running, status.completed, elapsed_time),
+                flush=True,
+                end='\r'
+            )
+            previous_status = status
+
         if status.completed == job_count:
             break
-        time.sleep(polling_interval)
+        # Block until another job completes (or the polling interval expires), rather than
+        # sleeping unconditionally; this wakes up immediately when the last job finishes
+        pool.wait_for_progress(polling_interval)
     
     # We need one final newline so that the next print statement will not overwrite the above
     # output
@@ -239,60 +256,111 @@ def _report_pool_status(
 
 def _create_simulations(
     sweep_cfg: SweepConfiguration,
+    sweep_dir: pathlib.Path,
     random_seed: Union[None, int, FunctionType, BuiltinFunctionType] = None,
     chunk_count: int = 1,
     chunk_index: int = 0,
 ) -> list[Simulation]:
     """
     Creates a list of Simulation objects for each (temperature, density) pair in the sweep.
+    The individual simulation directories are resolved against the given sweep_dir (the directory
+    that contains the sweep config file), so no change of working directory is needed.
 
-    Precondition: Our working directory is the same directory that contains the sweep config file,
-        so that relative directories from this location make sense.
-    
     Postcondition: All of the individual simulation directories will be created, and the individual
         run config files will be written (which allows simulations to be easily re-run)
     """
-    simulations = []
-
-    for temperature, density in sweep_cfg.sweep_range(chunk_count, chunk_index):
-        # Get the directory where the individual simulation will be run
-        simulation_dir = sweep_cfg.simulation_dir(temperature, density)
-        run_config_file = simulation_dir / sweep_cfg.templates.run_config_file
+    # Materialize all of the sweep points and format all of the simulation directories in one
+    # batch pass up front, rather than interleaving string formatting and directory creation with
+    # the per-point config file I/O below.
+    points = list(sweep_cfg.sweep_range(chunk_count, chunk_index))
+    simulation_dirs = [
+        sweep_dir / sweep_cfg.simulation_dir(temperature, density)
+        for temperature, density in points
+    ]
+
+    # Several simulation directories may share parents, so we create each unique directory
+    # exactly once, with a single os.makedirs call each, rather than making a redundant
+    # stat + mkdir pair per sweep point.
+    for directory in set(simulation_dirs):
+        os.makedirs(directory, exist_ok=True)
+
+    def prepare_one(point, simulation_dir) -> Configuration:
+        """
+        Builds, seeds, and writes the run configuration for a single sweep point.
+        """
+        temperature, density = point
+        # A plain string join is noticeably cheaper than Path.__truediv__ in this per-point path
+        run_config_file = os.path.join(os.fspath(simulation_dir),
+                                       sweep_cfg.templates.run_config_file)
 
         # Create run configuration object (introduces default random seed)
         run_cfg = _create_run_configuration(sweep_cfg, temperature, density)
 
         # Determine whether random seed should be updated
-        if random_seed is None and run_config_file.is_file():
-            existing_cfg = Configuration.from_file(run_config_file)
-            run_cfg.system.random_seed = existing_cfg.system.random_seed
+        if random_seed is None and os.path.isfile(run_config_file):
+            existing_seed = _read_random_seed(run_config_file)
+            if existing_seed is not None:
+                run_cfg.system.random_seed = existing_seed
         elif isinstance(random_seed, int):
             run_cfg.system.random_seed = random_seed
         elif isinstance(random_seed, (FunctionType, BuiltinFunctionType)):
             run_cfg.system.random_seed = random_seed()
-        
-        # Write config to file (possibly overwrites with new sweep_cfg data)
-        run_config_file.parent.mkdir(parents=True, exist_ok=True)
-        run_cfg.write(run_config_file)
 
+        # Write config to file (possibly overwrites with new sweep_cfg data).  The contents are
+        # rendered in memory first and written with a single low-level syscall, which avoids the
+        # buffered-I/O overhead of many small writes when preparing a large sweep.
+        contents = run_cfg.write_to_string().encode()
+        fd = os.open(run_config_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, contents)
+        finally:
+            os.close(fd)
+
+        return run_cfg
+
+    # The per-point preparation is dominated by filesystem work (stat, read of any existing
+    # config, write of the new one), so we overlap it with a thread pool.  sweep_cfg is only
+    # read by the workers, so no locking is needed, and executor.map preserves the point order.
+    max_workers = max(1, min(32, len(points)))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        run_cfgs = list(executor.map(prepare_one, points, simulation_dirs))
+
+    simulations = []
+
+    for run_cfg, simulation_dir in zip(run_cfgs, simulation_dirs):
         # We cannot change working directory for each individual simulation, so before creating
         # the Simulation object, we must prepend the simulation_dir to the output filepaths
         _prepend_simulation_dir(simulation_dir, run_cfg)
 
-        # Now create a Simulation and append it to the list
+        # Now create a Simulation and append it to the list.  Simulation construction touches
+        # C++ state, so we keep it serial on the main thread.
         simulations.append(Simulation(run_cfg))
-    
+
     return simulations
 
 
+def _read_random_seed(run_config_file: Union[str, pathlib.Path]) -> Optional[int]:
+    """
+    Reads just the random seed from an existing run config file.  We only need this single value,
+    so we use the ConfigParser directly rather than hydrating a full Configuration object.
+    """
+    parser = configparser.ConfigParser()
+    parser.read(run_config_file, encoding='utf-8')
+    return parser.getint('system', 'random_seed', fallback=None)
+
+
 def _prepend_simulation_dir(simulation_dir: pathlib.Path, run_cfg: Configuration):
     """
     Modifies run_cfg to prepend simulation_dir onto the paths.
     """
-    run_cfg.filepaths.event_log = str(simulation_dir / run_cfg.filepaths.event_log)
-    run_cfg.filepaths.thermodynamic_log = str(simulation_dir / run_cfg.filepaths.thermodynamic_log)
-    run_cfg.filepaths.observation_log = str(simulation_dir / run_cfg.filepaths.observation_log)
-    run_cfg.filepaths.snapshot_log = str(simulation_dir / run_cfg.filepaths.snapshot_log)
+    # Plain string joins onto a single precomputed prefix avoid building (and re-stringifying)
+    # four intermediate Path objects per sweep point
+    prefix = os.fspath(simulation_dir)
+    filepaths = run_cfg.filepaths
+    filepaths.event_log = os.path.join(prefix, filepaths.event_log)
+    filepaths.thermodynamic_log = os.path.join(prefix, filepaths.thermodynamic_log)
+    filepaths.observation_log = os.path.join(prefix, filepaths.observation_log)
+    filepaths.snapshot_log = os.path.join(prefix, filepaths.snapshot_log)
 
 
 def _create_run_configuration(
@@ -311,18 +379,23 @@ def _create_run_configuration(
     run_cfg.system.cutoff_distance = sweep_cfg.system.cutoff_distance
     run_cfg.system.time_delta = sweep_cfg.system.time_delta
 
-    run_cfg.equilibration.name = (sweep_cfg.templates.phase_name.format(
-        temperature=temperature, density=density, name=sweep_cfg.equilibration.name
-    ))
+    # Fill in the temperature and density fields of the phase name template once, leaving only
+    # the {name} field for the two phases below (the float formatting is the expensive part,
+    # and it is identical for both phases)
+    phase_name_template = (
+        sweep_cfg.templates.phase_name
+        .replace('{name}', '{{name}}')
+        .format(temperature=temperature, density=density)
+    )
+
+    run_cfg.equilibration.name = phase_name_template.format(name=sweep_cfg.equilibration.name)
     run_cfg.equilibration.tolerance = sweep_cfg.equilibration.tolerance
     run_cfg.equilibration.sample_size = sweep_cfg.equilibration.sample_size
     run_cfg.equilibration.adjustment_interval = sweep_cfg.equilibration.adjustment_interval
     run_cfg.equilibration.steady_state_time = sweep_cfg.equilibration.steady_state_time
     run_cfg.equilibration.timeout = sweep_cfg.equilibration.timeout
 
-    run_cfg.observation.name = (sweep_cfg.templates.phase_name.format(
-        temperature=temperature, density=density, name=sweep_cfg.observation.name
-    ))
+    run_cfg.observation.name = phase_name_template.format(name=sweep_cfg.observation.name)
     run_cfg.observation.tolerance = sweep_cfg.observation.tolerance
     run_cfg.observation.sample_size = sweep_cfg.observation.sample_size
     run_cfg.observation.observation_interval = sweep_cfg.observation.observation_interval
@@ -23,14 +23,35 @@ License along with Lennard-Jonesium.  If not, see
 
 from dataclasses import dataclass, field
 from typing import Iterator
-import itertools
+import functools
 import pathlib
 
-from more_itertools import divide
-
 from lennardjonesium.tools import INIParsable, DictParsable, linspace
 
 
+@functools.lru_cache(maxsize=None)
+def _linspace_axis(start: float, stop: float, steps: int) -> tuple[float, ...]:
+    """
+    Computes (and caches) one axis of the sweep grid.  The same axis is generated every time
+    sweep_range() is called -- once when creating the simulations and once per chunk when
+    collecting the results -- so caching at module level means the arithmetic runs only once
+    per distinct (start, stop, steps) triple.  A tuple is returned so the cached value is
+    immutable and safe to share.
+    """
+    return tuple(linspace(start, stop, steps, endpoint=True))
+
+
+@functools.lru_cache(maxsize=None)
+def _format_simulation_dir(template: str, temperature: float, density: float) -> pathlib.Path:
+    """
+    Formats (and caches) the simulation directory for a given template and sweep point.  The same
+    (temperature, density) pair is formatted both when the simulations are created and again when
+    the results are collected, so caching at module level avoids re-running the float formatting
+    and Path construction.
+    """
+    return pathlib.Path(template.format(temperature=temperature, density=density))
+
+
 @dataclass
 class SweepConfiguration(INIParsable, DictParsable):
     """
@@ -117,32 +138,39 @@ class SweepConfiguration(INIParsable, DictParsable):
         :param chunk_index: The index of the chunk to process on this run.  Must in the range
             0 <= chunk_index < chunk_count, as it is a list index.
         """
-        temperatures = linspace(
+        temperatures = _linspace_axis(
             self.system.temperature_start,
             self.system.temperature_stop,
-            self.system.temperature_steps,
-            endpoint=True
+            self.system.temperature_steps
         )
 
-        densities = linspace(
+        densities = _linspace_axis(
             self.system.density_start,
             self.system.density_stop,
-            self.system.density_steps,
-            endpoint=True
+            self.system.density_steps
         )
 
-        yield from list(
-            divide(chunk_count, itertools.product(temperatures, densities))
-        )[chunk_index]
+        # Compute the [start, stop) index range of the requested chunk directly, rather than
+        # materializing the full Cartesian product and discarding all chunks but one.  The chunk
+        # sizes match more_itertools.divide: the first (total % chunk_count) chunks get one
+        # extra point each.
+        density_steps = self.system.density_steps
+        total = self.system.temperature_steps * density_steps
+
+        base, remainder = divmod(total, chunk_count)
+        start = chunk_index * base + min(chunk_index, remainder)
+        stop = start + base + (1 if chunk_index < remainder else 0)
+
+        for index in range(start, stop):
+            temperature_index, density_index = divmod(index, density_steps)
+            yield temperatures[temperature_index], densities[density_index]
     
     def simulation_dir(self, temperature, density) -> pathlib.Path:
         """
         Returns the (relative) simulation directory corresponding to a given temperature and
         density.
         """
-        return pathlib.Path(self.templates.directory.format(
-            temperature=temperature, density=density
-        ))
+        return _format_simulation_dir(self.templates.directory, temperature, density)
     
     def simulation_dir_range(self,
         chunk_count: int = 1,
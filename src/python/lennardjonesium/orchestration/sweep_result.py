@@ -22,6 +22,9 @@ License along with Lennard-Jonesium.  If not, see
 
 
 from dataclasses import dataclass
+from typing import Optional
+import concurrent.futures
+import os
 import pathlib
 
 
@@ -50,34 +53,79 @@ class SweepResult:
         sweep_config_file: pathlib.Path,
         chunk_count: int = 1,
         chunk_index: int = 0,
+        sweep_cfg: Optional[SweepConfiguration] = None,
+        max_workers: Optional[int] = None,
     ) -> None:
+        """
+        :param sweep_cfg: An optional SweepConfiguration object.  If given, it is used directly
+            rather than re-reading and re-parsing the sweep_config_file (which callers such as
+            run_sweep() have usually already done).
+
+        :param max_workers: The number of threads used to read the event logs in parallel.
+            Defaults to min(32, 4 * cpu count), which suits SSDs; callers collecting from
+            storage that dislikes concurrent reads (e.g. spinning disks) can dial it down.
+        """
         self.completed = []
         self.equilibration_aborted = []
         self.observation_aborted = []
 
-        self._collect_results(sweep_config_file, chunk_count, chunk_index)
-    
+        # Remember which chunk of the sweep these results describe, so that later inspection of
+        # a SweepResult object can tell partial (chunked) collections apart from full ones
+        self._chunk_count = chunk_count
+        self._chunk_index = chunk_index
+
+        self._collect_results(sweep_config_file, sweep_cfg, max_workers)
+
     def _collect_results(self,
         sweep_config_file: pathlib.Path,
-        chunk_count: int = 1,
-        chunk_index: int = 0,
+        sweep_cfg: Optional[SweepConfiguration] = None,
+        max_workers: Optional[int] = None,
     ):
         """
         Collect the results from all the event logs that were generated in this simulation sweep.
         """
         sweep_dir = sweep_config_file.parent
-        sweep_cfg = SweepConfiguration.from_file(sweep_config_file)
+        if sweep_cfg is None:
+            sweep_cfg = SweepConfiguration.from_file(sweep_config_file)
+
+        simulation_dirs = list(
+            sweep_cfg.simulation_dir_range(self._chunk_count, self._chunk_index)
+        )
+        # String joins rather than chained Path.__truediv__; RunResult converts back to a Path
+        # only if the log actually gets parsed.  The sweep directory string and the template
+        # name are invariant, so we look them up once rather than per directory.
+        sweep_dir_str = os.fspath(sweep_dir)
+        template_name = sweep_cfg.templates.run_config_file
+        run_config_files = [
+            os.path.join(sweep_dir_str, os.fspath(simulation_dir), template_name)
+            for simulation_dir in simulation_dirs
+        ]
 
-        for simulation_dir in sweep_cfg.simulation_dir_range(chunk_count, chunk_index):
-            run_config_file = sweep_dir / simulation_dir / sweep_cfg.templates.run_config_file
-            
+        def _collect_one(run_config_file: pathlib.Path) -> RunResult:
+            """
+            Reads and parses one event log.  RunResult parses its log lazily, so we touch
+            simulation_status here to force the parse to happen inside the worker thread
+            rather than serially during classification below.
+            """
             run_result = RunResult(run_config_file)
+            run_result.simulation_status
+            return run_result
+
+        # Reading and parsing the event logs is I/O-bound and the files are independent, so we
+        # fan the reads out over a thread pool and do the classification serially afterwards
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            run_results = list(executor.map(_collect_one, run_config_files))
+
+        # A single dict lookup per result replaces the chain of enum comparisons
+        buckets = {
+            SimulationStatus.completed: self.completed,
+            SimulationStatus.equilibration_aborted: self.equilibration_aborted,
+            SimulationStatus.observation_aborted: self.observation_aborted,
+        }
 
-            if run_result.simulation_status == SimulationStatus.completed:
-                category = self.completed
-            elif run_result.simulation_status == SimulationStatus.equilibration_aborted:
-                category = self.equilibration_aborted
-            elif run_result.simulation_status == SimulationStatus.observation_aborted:
-                category = self.observation_aborted
-            
-            category.append(self._SimulationResult(simulation_dir, run_result))
+        for simulation_dir, run_result in zip(simulation_dirs, run_results):
+            buckets[run_result.simulation_status].append(
+                self._SimulationResult(simulation_dir, run_result)
+            )
@@ -23,6 +23,7 @@ License along with Lennard-Jonesium.  If not, see
 
 import argparse
 import pathlib
+import sys
 import time
 
 import lennardjonesium as lj
@@ -38,11 +39,19 @@ def parse_chunk_list(chunks: str) -> list[int]:
     return output
 
 def rest(rest_time: float, polling_interval: float):
+    # The countdown is only useful on an interactive terminal; in batch runs (stdout redirected)
+    # a single sleep avoids the periodic wakeups and does not clutter the output
+    if not sys.stdout.isatty():
+        time.sleep(rest_time)
+        return
+
     print()
-    while rest_time > 0:
-        print(f'Starting next chunk in {rest_time} seconds     ', end='\r')
-        rest_time -= polling_interval
-        time.sleep(polling_interval)
+    # Counting down from a monotonic deadline (rather than decrementing by the polling interval)
+    # keeps the total rest time accurate even though each print takes nonzero time
+    deadline = time.monotonic() + rest_time
+    while (remaining := deadline - time.monotonic()) > 0:
+        print(f'Starting next chunk in {remaining:.0f} seconds     ', end='\r')
+        time.sleep(min(polling_interval, remaining))
     print('\n')
 
 
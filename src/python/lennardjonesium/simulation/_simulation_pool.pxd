@@ -22,6 +22,7 @@ License along with Lennard-Jonesium.  If not, see
 
 
 from libcpp.memory cimport unique_ptr
+from libcpp.vector cimport vector
 
 from lennardjonesium.simulation._simulation cimport _Simulation
 
@@ -38,8 +39,10 @@ cdef extern from "<lennardjonesium/api/simulation_pool.hpp>" namespace "api" nog
             int completed
         
         void push(_Simulation&) except +
+        void push_many(const vector[_Simulation*]&) except +
         void close() except +
         void wait() except +
+        void wait_for_progress(double) except +
 
         _Status status() except +
 
@@ -24,6 +24,7 @@ License along with Lennard-Jonesium.  If not, see
 # cimports
 from libcpp.memory cimport unique_ptr, make_unique
 from libcpp.utility cimport move
+from libcpp.vector cimport vector
 
 from lennardjonesium.simulation._simulation cimport _Simulation, Simulation
 from lennardjonesium.simulation._simulation_pool cimport _SimulationPool
@@ -75,7 +76,28 @@ cdef class SimulationPool:
         cdef Simulation _simulation = <Simulation?> simulation
 
         self.cpp_simulation_pool().push(_simulation.cpp_simulation()[0])
-    
+
+    def push_many(self, simulations):
+        """
+        Pushes a whole batch of Simulations onto the queue in one call.  This crosses the
+        Python/C++ boundary once for the entire batch (and updates the pool's queued count with
+        a single atomic add), rather than once per Simulation as a loop over push() would.
+        """
+        cdef vector[_Simulation*] _simulations
+        cdef Simulation _simulation
+
+        _simulations.reserve(len(simulations))
+        for simulation in simulations:
+            _simulation = <Simulation?> simulation
+            _simulations.push_back(_simulation.cpp_simulation())
+
+        # The pointer must be obtained before releasing the GIL, since cpp_simulation_pool()
+        # is a GIL-requiring method
+        cdef _SimulationPool* pool = self.cpp_simulation_pool()
+
+        with nogil:
+            pool.push_many(_simulations)
+
     def close(self):
         """
         If no further jobs will be pushed, then you can call close() to allow the workers to be
@@ -93,6 +115,22 @@ cdef class SimulationPool:
         """
         self.cpp_simulation_pool().wait()
     
+    def wait_for_progress(self, timeout: float = 0.5):
+        """
+        Blocks until at least one further job completes, or until the given timeout (in seconds)
+        expires, whichever comes first.  This is useful for status reporting: instead of sleeping
+        for a fixed polling interval, one can wait on actual progress and wake up immediately
+        when the last job finishes.
+        """
+        cdef double cpp_timeout = <double> timeout
+
+        # The pointer must be obtained before releasing the GIL, since cpp_simulation_pool()
+        # is a GIL-requiring method
+        cdef _SimulationPool* pool = self.cpp_simulation_pool()
+
+        with nogil:
+            pool.wait_for_progress(cpp_timeout)
+
     def status(self):
         """
         Get the current status of the workers.
@@ -1,3 +1,5 @@
 from lennardjonesium.tools.ini_parsable import INIParsable
 from lennardjonesium.tools.dict_parsable import DictParsable
 from lennardjonesium.tools.linspace import linspace
+from lennardjonesium.tools.last_line import last_line, last_line_bytes
+from lennardjonesium.tools.cached_from_file import cached_from_file
@@ -0,0 +1,49 @@
+"""
+cached_from_file.py
+
+Copyright (c) 2021-2022 Benjamin E. Niehoff
+
+This file is part of Lennard-Jonesium.
+
+Lennard-Jonesium is free software: you can redistribute
+it and/or modify it under the terms of the GNU General Public
+License as published by the Free Software Foundation, either
+version 3 of the License, or (at your option) any later version.
+
+Lennard-Jonesium is distributed in the hope that it will
+be useful, but WITHOUT ANY WARRANTY; without even the implied
+warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with Lennard-Jonesium.  If not, see
+<https://www.gnu.org/licenses/>.
+"""
+
+
+import functools
+import os
+
+
+def cached_from_file(cls, filename):
+    """
+    Like cls.from_file(filename), but memoized on the file's identity, modification time, and
+    size, so that re-reading an unchanged file returns the already-parsed object without
+    touching the disk again.  During a sweep the same run config files are read at several
+    points (seeding, running, result collection), which makes repeated parses redundant.
+
+    The returned object is shared between all callers with a cache hit, so it must be treated
+    as read-only; callers which intend to modify it should use its clone() method (or parse the
+    file themselves via cls.from_file).
+
+    Works with any class offering a from_file() classmethod (e.g. the INIParsable mixin).
+    """
+    stat = os.stat(filename)
+    return _cached_from_file(cls, os.fspath(filename), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_from_file(cls, filename: str, mtime_ns: int, size: int):
+    # The mtime_ns and size arguments exist only as cache keys: if the file changes on disk,
+    # the key changes and the stale entry is simply never hit again
+    return cls.from_file(filename)
@@ -21,6 +21,9 @@ License along with Lennard-Jonesium.  If not, see
 """
 
 
+import dataclasses
+
+
 class DictParsable:
     """
     DictParsable is a mixin class that provides the functionality for dataclasses to read and write
@@ -30,6 +33,26 @@ class DictParsable:
     dataclass type from whatever arbitrary fields might exist in the dictionary.
     """
 
+    @classmethod
+    def _schema(cls):
+        """
+        Returns {section name: [(key, field type), ...]} for this dataclass, computed once per
+        class so the readers and writers below do not need to reflect over instance __dict__s on
+        every call.  INIParsable defines an identical method, so classes which mix in both (the
+        usual case) share one schema regardless of which definition the MRO selects.
+
+        (Built lazily on first use rather than in __init_subclass__, because the @dataclass
+        decorator has not yet been applied when __init_subclass__ runs.)
+        """
+        if '_schema_cache' not in cls.__dict__:
+            cls._schema_cache = {
+                section.name: [
+                    (key.name, key.type) for key in dataclasses.fields(section.type)
+                ]
+                for section in dataclasses.fields(cls)
+            }
+        return cls._schema_cache
+
     @classmethod
     def from_dict(cls, d: dict):
         """
@@ -44,20 +67,30 @@ class DictParsable:
         Creates a nested dictionary from the fields in this dataclass.
         """
         d = {}
-        for section in self.__dict__:
-            d[section] = {}
-            for key in self.__getattribute__(section).__dict__:
-                d[section][key] = self.__getattribute__(section).__getattribute__(key)
+        for section, keys in self._schema().items():
+            # Look up the section object once, rather than traversing self per field
+            section_obj = getattr(self, section)
+            d[section] = {key: getattr(section_obj, key) for key, _field_type in keys}
         return d
     
+    def clone(self):
+        """
+        Creates an independent copy of this dataclass.  This round-trips through the dictionary
+        representation, which only touches the fields we actually define, and so is much cheaper
+        than copy.deepcopy's fully general recursive object walk.
+        """
+        return type(self).from_dict(self.to_dict())
+
     def _read_dict(self, d: dict):
         """
         Sets the fields based on values from a dictionary.
         """
         # We only look for the keys that are actually defined in the dataclass, so if the
         # dictionary contains additional keys, they will be ignored
-        for section in self.__dict__:
+        for section, keys in self._schema().items():
             if section in d:
-                for key in self.__getattribute__(section).__dict__:
-                    if key in d[section]:
-                        self.__getattribute__(section).__setattr__(key, d[section][key])
+                d_section = d[section]
+                section_obj = getattr(self, section)
+                for key, _field_type in keys:
+                    if key in d_section:
+                        setattr(section_obj, key, d_section[key])
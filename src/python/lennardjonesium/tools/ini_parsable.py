@@ -22,6 +22,8 @@ License along with Lennard-Jonesium.  If not, see
 
 
 import configparser
+import dataclasses
+import io
 
 
 class INIParsable:
@@ -33,6 +35,27 @@ class INIParsable:
     dataclass type from whatever arbitrary fields might exist in the .ini file.
     """
     
+    @classmethod
+    def _schema(cls):
+        """
+        Returns {section name: [(key, field type), ...]} for this dataclass, computed once per
+        class.  The reader used to rediscover this layout on every parse by reflecting over
+        instance __dict__s and calling type() per field; the schema makes a parse two tight
+        loops instead.  DictParsable defines an identical method, so classes which mix in both
+        (the usual case) share one schema regardless of which definition the MRO selects.
+
+        (This is built lazily on first use, rather than in __init_subclass__, because the
+        @dataclass decorator has not yet been applied when __init_subclass__ runs.)
+        """
+        if '_schema_cache' not in cls.__dict__:
+            cls._schema_cache = {
+                section.name: [
+                    (key.name, key.type) for key in dataclasses.fields(section.type)
+                ]
+                for section in dataclasses.fields(cls)
+            }
+        return cls._schema_cache
+
     @classmethod
     def from_file(cls, filename: str):
         """
@@ -47,44 +70,58 @@ class INIParsable:
         Reads a dataclass from a file.
         """
         parser = configparser.ConfigParser()
-        parser.read(filename)
+        # An explicit encoding skips the locale lookup that the default would perform per file,
+        # and makes the file format independent of the machine's locale
+        parser.read(filename, encoding='utf-8')
         self._read_config_parser(parser)
-    
+
     def write(self, filename: str):
         """
         Writes a dataclass to a file
         """
+        with open(filename, 'w', encoding='utf-8') as outfile:
+            outfile.write(self.write_to_string())
+
+    def write_to_string(self) -> str:
+        """
+        Renders the dataclass in .ini format and returns the result as a string.  This lets
+        callers assemble the whole file contents in memory and emit them with a single write,
+        instead of the many small writes that ConfigParser.write() would issue against a real
+        file object.
+        """
+        # Assemble the nested mapping first and ingest it with a single read_dict() call, which
+        # avoids going through the ConfigParser section proxy once per key
+        data = {}
+        for section, keys in self._schema().items():
+            # Look up the section object once, rather than traversing self per field
+            section_obj = getattr(self, section)
+            data[section] = {key: str(getattr(section_obj, key)) for key, _field_type in keys}
+
         parser = configparser.ConfigParser()
+        parser.read_dict(data)
 
-        for section in self.__dict__:
-            parser.add_section(section)
-            for key in self.__getattribute__(section).__dict__:
-                parser[section][key] = str(self.__getattribute__(section).__getattribute__(key))
-        
-        with open(filename, 'w') as outfile:
-            parser.write(outfile)
+        buffer = io.StringIO()
+        parser.write(buffer)
+        return buffer.getvalue()
     
     def _read_config_parser(self, cp: configparser.ConfigParser):
         """
         Sets the fields based on values from a ConfigParser.
         """
+        # The typed getters, bound to this particular ConfigParser
+        getters = {int: cp.getint, float: cp.getfloat, bool: cp.getboolean}
+
         # We only look for the keys that are actually defined in the dataclass, so if the
         # ConfigParser contains additional keys, they will be ignored
-        for section in self.__dict__:
+        for section, keys in self._schema().items():
             if section in cp:
-                for key in self.__getattribute__(section).__dict__:
-                    if key in cp[section]:
+                cp_section = cp[section]
+                section_obj = getattr(self, section)
+                for key, field_type in keys:
+                    if key in cp_section:
                         # We need to use different methods to automatically parse the values into
                         # the appropriate type
-                        field_type = type(self.__getattribute__(section).__getattribute__(key))
-
-                        if field_type is int:
-                            value = cp.getint(section, key)
-                        elif field_type is float:
-                            value = cp.getfloat(section, key)
-                        elif field_type is bool:
-                            value = cp.getboolean(section, key)
-                        else:
-                            value = cp[section][key]
-
-                        self.__getattribute__(section).__setattr__(key, value)
+                        getter = getters.get(field_type)
+                        value = getter(section, key) if getter else cp_section[key]
+
+                        setattr(section_obj, key, value)
@@ -0,0 +1,69 @@
+"""
+last_line.py
+
+Copyright (c) 2021-2022 Benjamin E. Niehoff
+
+This file is part of Lennard-Jonesium.
+
+Lennard-Jonesium is free software: you can redistribute
+it and/or modify it under the terms of the GNU General Public
+License as published by the Free Software Foundation, either
+version 3 of the License, or (at your option) any later version.
+
+Lennard-Jonesium is distributed in the hope that it will
+be useful, but WITHOUT ANY WARRANTY; without even the implied
+warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with Lennard-Jonesium.  If not, see
+<https://www.gnu.org/licenses/>.
+"""
+
+
+import os
+
+# How many bytes to read per step while scanning backwards.  One filesystem block is plenty:
+# event log lines are short, so the last line is almost always found in the first block read.
+_BLOCK_SIZE = 4096
+
+
+def last_line(filename) -> str:
+    """
+    Returns the last (non-empty) line of a text file, without reading the whole file.
+
+    This is a decoding convenience wrapper around last_line_bytes(); see there for details.
+    """
+    return last_line_bytes(filename).decode()
+
+
+def last_line_bytes(filename) -> bytes:
+    """
+    Returns the last (non-empty) line of a file as bytes, without reading the whole file.
+
+    The file is scanned backwards in blocks from the end, so the cost is independent of the file
+    size.  This is useful for large log files whose final entry summarizes the outcome.  Callers
+    that only need to compare the result against known byte patterns can skip decoding entirely
+    by using this variant.  Raises ValueError if the file contains no non-empty lines.
+    """
+    with open(filename, 'rb') as file:
+        file.seek(0, os.SEEK_END)
+        position = file.tell()
+        buffer = b''
+
+        while position > 0:
+            read_size = min(_BLOCK_SIZE, position)
+            position -= read_size
+            file.seek(position)
+            buffer = file.read(read_size) + buffer
+
+            # Ignore any trailing newlines when looking for the start of the last line
+            newline = buffer.rfind(b'\n', 0, len(buffer.rstrip(b'\n')))
+            if newline >= 0:
+                return buffer[newline + 1:].rstrip(b'\n')
+
+        # The entire file fit in the buffer without containing an interior newline
+        line = buffer.rstrip(b'\n')
+        if not line:
+            raise ValueError(f'{filename} contains no non-empty lines')
+        return line
@@ -21,15 +21,27 @@ License along with Lennard-Jonesium.  If not, see
 """
 
 
-def linspace(start: float, stop: float, points: int, endpoint: bool = True) -> list[int]:
+# Numpy remains strictly optional: we will not require the dependency just to use one function,
+# but if it happens to be installed, its vectorized linspace beats the per-point Python
+# arithmetic below for large axes
+try:
+    import numpy as _numpy
+except ImportError:
+    _numpy = None
+
+
+def linspace(start: float, stop: float, points: int, endpoint: bool = True) -> list[float]:
     """
     Creates a list of `points` evenly-spaced points in the interval [start, stop] (if endpoint
     is True), or [start, stop) (if endpoint is False).
 
-    This is the same as Numpy's linspace() function, but this function uses Python's native float
-    type and avoids having a Numpy dependency in the project just to use one function (and not to
-    use any of Numpy's most useful features).
+    This is the same as Numpy's linspace() function, but returns Python's native float type.
+    Numpy is used for the computation when it is available; otherwise a pure-Python fallback
+    keeps the project free of the dependency.
     """
+    if _numpy is not None:
+        return _numpy.linspace(start, stop, points, endpoint=endpoint).tolist()
+
     length = stop - start
     denominator = (points - 1) if endpoint else points
     return [start + (count / denominator) * length for count in range(points)]
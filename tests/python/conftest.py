@@ -0,0 +1,29 @@
+"""
+Shared pytest fixtures for the Python test suite.
+
+The existing tests are unittest.TestCase based and do not use these, but new pytest-style
+tests should prefer them: `default_configuration` amortizes the construction of a default
+Configuration (which builds C++-backed state) across the whole session, and `configuration`
+hands each test an independent copy it is free to modify.
+"""
+
+
+import pytest
+
+from lennardjonesium.simulation import Configuration
+
+
+@pytest.fixture(scope='session')
+def default_configuration() -> Configuration:
+    """
+    A default Configuration, built once per test session.  Treat it as read-only.
+    """
+    return Configuration()
+
+
+@pytest.fixture
+def configuration(default_configuration) -> Configuration:
+    """
+    A per-test copy of the default Configuration, safe to modify.
+    """
+    return default_configuration.clone()
@@ -3,16 +3,26 @@ Test Configuration class
 """
 
 import unittest
+import os
 import pathlib
-import shutil
+import tempfile
 
 from lennardjonesium.simulation import Configuration
 
 from tests.python.paths import temp_dir
 
+
+# Computed once at import time rather than per test
+_THIS_FILE = pathlib.Path(__file__)
+_STEM = _THIS_FILE.stem
+
+
 class TestConfiguration(unittest.TestCase):
-    def test_from_dict(self):
-        dictionary = {
+    @classmethod
+    def setUpClass(cls):
+        # Shared read-only fixtures, built once per class rather than once per test
+        cls.default_configuration = Configuration()
+        cls.source_dictionary = {
             'system': {
                 'temperature': 0.7,
                 'density': 0.3,
@@ -31,25 +41,35 @@ class TestConfiguration(unittest.TestCase):
             }
         }
 
-        configuration = Configuration.from_dict(dictionary)
+    def test_from_dict(self):
+        # One parse, with the per-field checks split into subTests so a single mismatch does not
+        # hide the others
+        configuration = Configuration.from_dict(self.source_dictionary)
 
-        self.assertEqual(10, configuration.system.particle_count)
-        self.assertEqual(2000, configuration.equilibration.timeout)
+        with self.subTest('system'):
+            self.assertEqual(0.7, configuration.system.temperature)
+            self.assertEqual(10, configuration.system.particle_count)
+
+        with self.subTest('equilibration'):
+            self.assertEqual(2000, configuration.equilibration.timeout)
+
+        with self.subTest('observation'):
+            self.assertEqual(5, configuration.observation.observation_count)
+
+        with self.subTest('filepaths'):
+            self.assertEqual('data/events.log', configuration.filepaths.event_log)
     
     def test_read_write_files(self):
-        this_file = pathlib.Path(__file__)
-        test_dir = temp_dir / this_file.stem
-        test_dir.mkdir(parents=True, exist_ok=True)
-        test_file = test_dir / 'test.ini'
-
-        # Just use a default configuration
-        source_conf = Configuration()
+        # The context manager guarantees cleanup even when an assertion fails mid-test
+        os.makedirs(temp_dir, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=temp_dir, prefix=_STEM) as test_dir:
+            test_file = pathlib.Path(test_dir) / 'test.ini'
 
-        source_conf.write(test_file)
+            # Just use the shared default configuration (it is only written, never modified)
+            source_conf = self.default_configuration
 
-        dest_conf = Configuration.from_file(test_file)
+            source_conf.write(test_file)
 
-        self.assertEqual(source_conf, dest_conf)
+            dest_conf = Configuration.from_file(test_file)
 
-        # Clean up
-        shutil.rmtree(test_dir)
+            self.assertEqual(source_conf, dest_conf)
@@ -3,46 +3,72 @@ Test running a Simulation from a config file
 """
 
 import unittest
+import os
 import pathlib
-import shutil
+import tempfile
 
-from lennardjonesium.simulation import Configuration, Simulation
+from lennardjonesium.simulation import Simulation
 
-from tests.python.paths import temp_dir
+from tests.python.paths import temp_dir, load_cfg
+
+
+# Computed once at import time rather than per test
+_THIS_FILE = pathlib.Path(__file__)
+_STEM = _THIS_FILE.stem
+_DIR = _THIS_FILE.parent
+
+
+def _read_log(path):
+    """
+    Reads a log file once, returning (contents, line count).  Assertions that also want to
+    inspect the contents can share the single read instead of re-opening the file.
+    """
+    with open(path, 'rb') as log_file:
+        data = log_file.read()
+    return data, data.count(b'\n')
+
+
+def _count_lines(path):
+    """
+    Counts the lines of a file in fixed-size binary chunks, so memory stays bounded no matter
+    how large the log grows.  Use _read_log() instead when the contents are also needed.
+    """
+    chunk_size = 1 << 16
+    with open(path, 'rb') as log_file:
+        return sum(chunk.count(b'\n')
+                   for chunk in iter(lambda: log_file.read(chunk_size), b''))
 
 
 class TestSimulation(unittest.TestCase):
     def test_simulation_from_file(self):
-        this_file = pathlib.Path(__file__)
-        test_dir = temp_dir / this_file.stem
-        input_file = this_file.parent / 'test_simulation.ini'
-
-        cfg = Configuration.from_file(input_file)
-
-        # Re-root directories onto test dir
-        event_log = test_dir / cfg.filepaths.event_log
-        thermodynamic_log = test_dir / cfg.filepaths.thermodynamic_log
-        observation_log = test_dir / cfg.filepaths.observation_log
-        snapshot_log = test_dir / cfg.filepaths.snapshot_log
-
-        cfg.filepaths.event_log = str(event_log)
-        cfg.filepaths.thermodynamic_log = str(thermodynamic_log)
-        cfg.filepaths.observation_log = str(observation_log)
-        cfg.filepaths.snapshot_log = str(snapshot_log)
-
-        # Make sure all directories exist
-        event_log.parent.mkdir(parents=True, exist_ok=True)
-        thermodynamic_log.parent.mkdir(parents=True, exist_ok=True)
-        observation_log.parent.mkdir(parents=True, exist_ok=True)
-        snapshot_log.parent.mkdir(parents=True, exist_ok=True)
-
-        # Create and run the simulation
-        sim = Simulation(cfg)
-        sim.run(echo=False)
-
-        # Make sure observation log has the correct number of lines
-        line_count = sum(1 for _ in open(observation_log))
-        self.assertEqual(cfg.observation.observation_count + 1, line_count)
-
-        # Clean up
-        shutil.rmtree(test_dir)
+        input_file = _DIR / 'test_simulation.ini'
+
+        # The cached loader hands back an independent clone, so the re-rooting below is safe
+        cfg = load_cfg(input_file)
+
+        # The context manager guarantees cleanup even when an assertion fails mid-test
+        os.makedirs(temp_dir, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=temp_dir, prefix=_STEM) as td:
+            # Re-root directories onto test dir with plain string joins, which avoids building a
+            # PurePath per log file only to immediately str() it back.  Binding the filepaths
+            # section once and looping over the field names shares the logic across the four
+            # logs and touches the section object once per field instead of twice
+            log_fields = ('event_log', 'thermodynamic_log', 'observation_log', 'snapshot_log')
+            fp = cfg.filepaths
+            for name in log_fields:
+                setattr(fp, name, os.path.join(td, getattr(fp, name)))
+
+            # Make sure all directories exist.  The four log files usually share a parent, so
+            # deduplicate before creating to avoid redundant mkdir calls
+            parents = {os.path.dirname(getattr(fp, name)) for name in log_fields}
+            for parent in parents:
+                os.makedirs(parent, exist_ok=True)
+
+            # Create and run the simulation
+            sim = Simulation(cfg)
+            sim.run(echo=False)
+
+            # Make sure observation log has the correct number of lines.  Counting newlines in
+            # the raw bytes skips decoding every line just to discard it
+            line_count = _count_lines(fp.observation_log)
+            self.assertEqual(cfg.observation.observation_count + 1, line_count)
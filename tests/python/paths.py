@@ -1,15 +1,45 @@
 """
 Some useful paths for tests that deal with reading and writing files.
+
+The directory used for test output can be overridden with the LJ_TEST_TMPDIR environment
+variable; CI can point it at a ramdisk (e.g. LJ_TEST_TMPDIR=/dev/shm/lj-tests) to take disk
+latency out of the file-writing tests.
 """
 
 
+import functools
+import os
 import pathlib
 
+from lennardjonesium.simulation import Configuration
+
 
-temp_dir = pathlib.Path('temp/')
+temp_dir = pathlib.Path(os.environ.get('LJ_TEST_TMPDIR', 'temp/'))
+
+# Parallel runners (pytest-xdist) set PYTEST_XDIST_WORKER; giving each worker its own
+# subdirectory keeps the outputs of concurrently-running tests apart
+_worker_id = os.environ.get('PYTEST_XDIST_WORKER')
+if _worker_id is not None:
+    temp_dir = temp_dir / _worker_id
 python_dir = pathlib.Path('tests/python/')
 lj_dir = python_dir / 'lennardjonesium'
 
 
 def file_stem(filename: str):
     return pathlib.Path(filename).stem
+
+
+@functools.lru_cache(maxsize=8)
+def _load_cfg_cached(path_str: str, mtime_ns: int) -> Configuration:
+    # mtime_ns is only a cache key: editing the file invalidates the entry
+    return Configuration.from_file(pathlib.Path(path_str))
+
+
+def load_cfg(path) -> Configuration:
+    """
+    Reads a Configuration from a file, caching the parse on (path, mtime) so tests that share a
+    static .ini fixture do not re-parse it per test.  Each call returns an independent clone, so
+    tests are free to modify the result.
+    """
+    stat = os.stat(path)
+    return _load_cfg_cached(os.fspath(path), stat.st_mtime_ns).clone()